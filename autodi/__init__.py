@@ -1,4 +1,6 @@
-from .config.config import DIConfig
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .container import Container, inject
 from .exceptions import (
     AsyncDependencyError,
@@ -9,7 +11,10 @@ from .exceptions import (
     ScopeError,
 )
 from .scopes import Scope
-from .utils.plugins import ContainerWithPlugins, DIPlugin
+
+if TYPE_CHECKING:
+    from .config.config import DIConfig
+    from .utils.plugins import ContainerWithPlugins, DIPlugin
 
 __all__ = [
     "Container",
@@ -27,3 +32,37 @@ __all__ = [
 ]
 
 __version__ = (1, 0, 2)
+
+# Public names whose modules are imported on first access (PEP 562).
+# DIConfig pulls in PyYAML, which most users of the container never need.
+_LAZY: dict[str, tuple[str, str]] = {
+    "DIConfig": ("autodi.config.config", "DIConfig"),
+    "ContainerWithPlugins": ("autodi.utils.plugins", "ContainerWithPlugins"),
+    "DIPlugin": ("autodi.utils.plugins", "DIPlugin"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Imports lazily exported names on first access.
+
+    Args:
+        name: The attribute being looked up.
+
+    Returns:
+        The requested object.
+
+    Raises:
+        AttributeError: If the name is not exported by the package.
+    """
+    spec = _LAZY.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_path, attr = spec
+    obj = getattr(import_module(module_path), attr)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    """Lists module attributes, including the lazily exported names."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,7 @@
+import functools
+import marshal
+import os
+import sys
 from importlib import import_module
 from pathlib import Path
 from typing import Any
@@ -6,6 +10,27 @@ import yaml
 
 from ..scopes import Scope
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+_Entry = tuple[Any, Any, Any, Any, Any]
+"(interface_path, implementation_path, scope, init_hook, destroy_hook) as read from the YAML file."
+
+_Registration = tuple[str, Any, Any, Any, Any, Any]
+"""(interface_path, interface, implementation, scope, init_hook, destroy_hook).
+
+Everything but the path is passed to register(); the path names the entry in error messages.
+"""
+
+_CACHE_SUFFIX = ".autodi-cache"
+_CACHE_VERSION = 1
+
+# Resolved registrations per absolute config path, stamped with the file's
+# (st_mtime_ns, st_size) so that edited files are parsed again.
+_PARSE_CACHE: dict[str, tuple[int, int, list[_Registration]]] = {}
+
 
 class DIConfig:
     """Loads dependency configurations from a YAML file."""
@@ -22,6 +47,11 @@ class DIConfig:
     def load_from_yaml(self, file_path: str | Path) -> None:
         """Loads and registers dependencies from a YAML configuration file.
 
+        Parsed files are cached for the lifetime of the process and, when the
+        directory is writable, in a ``<file>.autodi-cache`` file next to the
+        config. Both caches are reused only while the file's modification time
+        and size are unchanged.
+
         Args:
             file_path: The path to the YAML file.
 
@@ -31,52 +61,169 @@ class DIConfig:
             ValueError: If the YAML file is malformed or contains errors.
         """
         path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found at: {path}")
-
         try:
-            config = yaml.safe_load(path.read_text())
-        except yaml.YAMLError as e:
-            raise ValueError(f"Failed to parse YAML file: {e}") from e
-
-        if not isinstance(config, dict) or "dependencies" not in config:
-            return
-
-        for interface_path, params in config["dependencies"].items():
-            try:
-                interface = self._import_class(interface_path)
-                implementation_path = params.get("implementation")
-                implementation = (
-                    self._import_class(implementation_path) if implementation_path else None
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found at: {path}") from None
+
+        key = str(path.resolve())
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            registrations = cached[2]
+        else:
+            registrations = self._parse(path, stat.st_mtime_ns, stat.st_size)
+            _PARSE_CACHE[key] = (stat.st_mtime_ns, stat.st_size, registrations)
+
+        interface_path = None
+        try:
+            for registration in registrations:
+                interface_path, interface, implementation, scope, init_hook, destroy_hook = (
+                    registration
                 )
-
                 self._container.register(
                     interface=interface,
                     implementation=implementation,
-                    scope=params.get("scope", Scope.APP),
-                    init_hook=params.get("init_hook"),
-                    destroy_hook=params.get("destroy_hook"),
+                    scope=scope,
+                    init_hook=init_hook,
+                    destroy_hook=destroy_hook,
+                )
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Error processing dependency '{interface_path}': {e}") from e
+
+    def _parse(self, path: Path, mtime_ns: int, size: int) -> list[_Registration]:
+        """Reads the dependency entries of a config file and imports the referenced classes.
+
+        Args:
+            path: The path to the YAML file.
+            mtime_ns: The file's modification time, used to validate the on-disk cache.
+            size: The file's size, used to validate the on-disk cache.
+
+        Returns:
+            The registrations described by the file, in file order.
+
+        Raises:
+            ValueError: If the YAML file is malformed or contains errors.
+        """
+        cache_path = path.with_name(path.name + _CACHE_SUFFIX)
+        entries = _read_disk_cache(cache_path, mtime_ns, size)
+        if entries is None:
+            entries = self._read_entries(path)
+            _write_disk_cache(cache_path, mtime_ns, size, entries)
+
+        registrations = []
+        for interface_path, implementation_path, scope, init_hook, destroy_hook in entries:
+            try:
+                interface = _import_class(interface_path)
+                implementation = (
+                    _import_class(implementation_path) if implementation_path else None
                 )
-            except (KeyError, ImportError, TypeError) as e:
+            except (ImportError, TypeError) as e:
                 raise ValueError(
                     f"Error processing dependency '{interface_path}': {e}"
                 ) from e  # noqa: PERF203
+            registrations.append(
+                (interface_path, interface, implementation, scope, init_hook, destroy_hook)
+            )
+        return registrations
 
-    def _import_class(self, class_path: str) -> type[Any]:
-        """Dynamically imports a class from a string path.
+    def _read_entries(self, path: Path) -> list[_Entry]:
+        """Parses the dependency entries of a YAML file without importing anything.
 
         Args:
-            class_path: The full path to the class (e.g., 'my_module.MyClass').
+            path: The path to the YAML file.
 
         Returns:
-            The imported class.
+            (interface_path, implementation_path, scope, init_hook, destroy_hook) tuples.
 
         Raises:
-            ImportError: If the class cannot be imported.
+            ValueError: If the YAML file is malformed or contains errors.
         """
         try:
-            module_path, class_name = class_path.rsplit(".", 1)
-            module = import_module(module_path)
-            return getattr(module, class_name)
-        except (ImportError, AttributeError, ValueError) as e:
-            raise ImportError(f"Failed to import class '{class_path}': {e}") from e
+            config = yaml.load(path.read_bytes(), Loader=_SafeLoader)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Failed to parse YAML file: {e}") from e
+
+        if not isinstance(config, dict) or "dependencies" not in config:
+            return []
+
+        entries = []
+        for interface_path, params in config["dependencies"].items():
+            try:
+                entries.append(
+                    (
+                        interface_path,
+                        params.get("implementation"),
+                        params.get("scope", Scope.APP),
+                        params.get("init_hook"),
+                        params.get("destroy_hook"),
+                    )
+                )
+            except (KeyError, TypeError, AttributeError) as e:
+                raise ValueError(
+                    f"Error processing dependency '{interface_path}': {e}"
+                ) from e  # noqa: PERF203
+        return entries
+
+
+@functools.cache
+def _import_class(class_path: str) -> type[Any]:
+    """Dynamically imports a class from a string path.
+
+    Results are memoized per process, so entries sharing a class path
+    (or repeated loads of the same config) import it only once.
+
+    Args:
+        class_path: The full path to the class (e.g., 'my_module.MyClass').
+
+    Returns:
+        The imported class.
+
+    Raises:
+        ImportError: If the class cannot be imported.
+    """
+    try:
+        module_path, class_name = class_path.rsplit(".", 1)
+        module = sys.modules.get(module_path) or import_module(module_path)
+        return getattr(module, class_name)
+    except (ImportError, AttributeError, ValueError) as e:
+        raise ImportError(f"Failed to import class '{class_path}': {e}") from e
+
+
+def _read_disk_cache(cache_path: Path, mtime_ns: int, size: int) -> list[_Entry] | None:
+    """Reads config entries from a marshal cache file.
+
+    Args:
+        cache_path: The path to the cache file.
+        mtime_ns: The expected modification time of the config file.
+        size: The expected size of the config file.
+
+    Returns:
+        The cached entries, or None if the cache is missing, unreadable or stale.
+    """
+    try:
+        version, cached_mtime, cached_size, entries = marshal.loads(cache_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (version, cached_mtime, cached_size) != (_CACHE_VERSION, mtime_ns, size):
+        return None
+    return [tuple(entry) for entry in entries]
+
+
+def _write_disk_cache(cache_path: Path, mtime_ns: int, size: int, entries: list[_Entry]) -> None:
+    """Atomically writes config entries to a marshal cache file.
+
+    Failures are ignored: the cache is an optimization and the config
+    directory may well be read-only.
+
+    Args:
+        cache_path: The path to the cache file.
+        mtime_ns: The modification time of the config file.
+        size: The size of the config file.
+        entries: The entries to store.
+    """
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(marshal.dumps((_CACHE_VERSION, mtime_ns, size, entries)))
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError):
+        tmp_path.unlink(missing_ok=True)
@@ -1,7 +1,8 @@
+import contextlib
 import inspect
-from collections import defaultdict
-from collections.abc import AsyncGenerator, Callable, Generator
-from contextlib import asynccontextmanager, contextmanager
+from collections.abc import Callable, Generator, Iterable
+from contextlib import AbstractAsyncContextManager, contextmanager
+from contextvars import ContextVar
 from typing import Any, TypeVar
 
 from .exceptions import (
@@ -15,11 +16,71 @@ from .types import InjectionTarget
 
 T = TypeVar("T")
 
+_MISS: Any = object()
+"Sentinel for cache lookups, distinguishing a missing entry from a cached ``None``."
+
+
+def _is_awaitable(obj: Any) -> bool:
+    """Checks whether an object implements the awaitable protocol.
+
+    A cheaper stand-in for ``inspect.isawaitable`` on the resolution path,
+    where the object is almost always a plain instance.
+
+    Args:
+        obj: The object to check.
+
+    Returns:
+        True if the object can be awaited.
+    """
+    return hasattr(type(obj), "__await__")
+
+
+def _compile_builder(
+    cls: type[Any],
+    params: tuple[tuple[str, Any, bool], ...],
+    resolve: Callable[[Any], Any],
+    providers: dict[Any, Any],
+) -> Callable[[], Any]:
+    """Generates a straight-line factory for a class with known constructor parameters.
+
+    For ``Service(repo: Repo, cache: Cache)`` the generated function is
+    ``def build(): return cls(repo=resolve(t0), cache=resolve(t1))``, which
+    avoids building and unpacking a keyword dict on every instantiation.
+    A parameter with a default value is passed as
+    ``**({"name": resolve(tN)} if tN in providers else {})``, so that its
+    default is kept unless a provider is registered for its type.
+
+    Args:
+        cls: The class to instantiate.
+        params: The (name, type, has_default) triples of the constructor parameters.
+        resolve: The function resolving each parameter type.
+        providers: The container's registered providers.
+
+    Returns:
+        A zero-argument function creating an instance of the class.
+    """
+    namespace: dict[str, Any] = {"cls": cls, "resolve": resolve, "providers": providers}
+    arguments = []
+    for index, (name, param_type, has_default) in enumerate(params):
+        namespace[f"t{index}"] = param_type
+        if has_default:
+            arguments.append(
+                f"**({{{name!r}: resolve(t{index})}} if t{index} in providers else {{}})"
+            )
+        else:
+            arguments.append(f"{name}=resolve(t{index})")
+
+    source = f"def build():\n    return cls({', '.join(arguments)})\n"
+    exec(compile(source, f"<autodi builder for {cls.__qualname__}>", "exec"), namespace)
+    build: Callable[[], Any] = namespace["build"]
+    build.__qualname__ = f"build_{cls.__name__}"
+    return build
+
 
 class Provider:
     """A provider for creating dependency instances."""
 
-    __slots__ = ("factory", "scope", "init_hook", "destroy_hook")
+    __slots__ = ("factory", "scope", "init_hook", "destroy_hook", "independent")
 
     def __init__(
         self,
@@ -27,6 +88,8 @@ class Provider:
         scope: ScopeType,
         init_hook: str | None = None,
         destroy_hook: str | None = None,
+        *,
+        independent: bool = False,
     ) -> None:
         """Initializes a Provider.
 
@@ -35,11 +98,14 @@ class Provider:
             scope: The scope in which the dependency should live.
             init_hook: The name of the method to call after creation.
             destroy_hook: The name of the method to call on scope cleanup.
+            independent: Whether the init hook may run concurrently with the
+                init hooks of other independent dependencies.
         """
         self.factory = factory
         self.scope = scope
         self.init_hook = init_hook
         self.destroy_hook = destroy_hook
+        self.independent = independent
 
     async def __call__(self) -> Any:
         """Creates and initializes the dependency instance.
@@ -47,27 +113,76 @@ class Provider:
         Returns:
             The created and initialized dependency instance.
         """
+        instance = await self.create()
+        result = self.start(instance)
+        if _is_awaitable(result):
+            await result
+        return instance
+
+    async def create(self) -> Any:
+        """Creates the dependency instance without initializing it.
+
+        Returns:
+            The created dependency instance.
+        """
         instance = self.factory()
-        if inspect.isawaitable(instance):
+        if _is_awaitable(instance):
             instance = await instance
+        return instance
+
+    def start(self, instance: Any) -> Any:
+        """Calls the init hook of a created instance, if it has one.
 
+        Args:
+            instance: The instance to initialize.
+
+        Returns:
+            The hook's result, which must be awaited if it is awaitable.
+        """
         if self.init_hook and hasattr(instance, self.init_hook):
-            hook = getattr(instance, self.init_hook)
-            result = hook()
-            if inspect.isawaitable(result):
-                await result
-        return instance
+            return getattr(instance, self.init_hook)()
+        return None
 
 
 class Container:
     """A dependency injection container with support for scopes and lifecycle hooks."""
 
+    __slots__ = (
+        "_providers",
+        "_app_instances",
+        "_request_instances",
+        "_cleanup_stacks",
+        "_resolution_stack",
+        "_resolution_set",
+        "_resolution_chain",
+        "_current_scope",
+        "_hints_cache",
+        "_spare_instances",
+        "_async_scopes",
+        "__weakref__",
+    )
+
     def __init__(self) -> None:
         """Initializes the Container."""
         self._providers: dict[Any, Provider] = {}
-        self._scoped_instances: defaultdict[ScopeType, dict[Any, Any]] = defaultdict(dict)
+        self._app_instances: dict[Any, Any] = {}
+        self._request_instances: dict[Any, Any] | None = None
+        self._cleanup_stacks: dict[ScopeType, list[Callable[[], Any]]] = {}
+        # Targets being resolved synchronously. Synchronous resolution never
+        # yields to other tasks, so a single stack per container is enough.
         self._resolution_stack: list[Any] = []
+        self._resolution_set: set[Any] = set()
+        # Targets being resolved asynchronously, outermost first. Tasks resolving
+        # concurrently each see their own chain through the context variable.
+        self._resolution_chain: ContextVar[tuple[Any, ...]] = ContextVar(
+            "autodi_resolution_chain", default=()
+        )
         self._current_scope: ScopeType | None = None
+        self._hints_cache: dict[type, tuple[tuple[str, Any, bool], ...]] = {}
+        # Reused between request scopes: only one scope can be active at a time,
+        # so a single cleared dict and one context manager per scope name suffice.
+        self._spare_instances: dict[Any, Any] = {}
+        self._async_scopes: dict[ScopeType, _AsyncScope] = {}
 
     def register(
         self,
@@ -78,6 +193,7 @@ class Container:
         provider: Callable[..., Any] | None = None,
         init_hook: str | None = None,
         destroy_hook: str | None = None,
+        independent: bool = False,
     ) -> None:
         """Registers a dependency with the container.
 
@@ -88,20 +204,49 @@ class Container:
             provider: A factory function to create the instance.
             init_hook: The name of a method to call after instantiation.
             destroy_hook: The name of a method to call when the scope is cleaned up.
+            independent: Declares that the init hook shares no state with other
+                dependencies, so ``resolve_many_async`` may run it concurrently
+                with the init hooks of other independent dependencies.
         """
         if implementation and provider:
             raise ValueError("Cannot specify both 'implementation' and 'provider' simultaneously.")
 
-        impl = implementation or interface
+        if provider is None:
+            provider = self._make_factory(implementation or interface)
+        self._providers[interface] = Provider(
+            provider, scope, init_hook, destroy_hook, independent=independent
+        )
 
-        def factory() -> Any:
-            if isinstance(impl, type):
-                return self._instantiate_class(impl)
-            if callable(impl):
-                return impl()
+    def _make_factory(self, impl: Any) -> Callable[..., Any]:
+        """Builds a factory specialized for a registered implementation.
+
+        The type checks and constructor introspection are done here, once,
+        so that resolving the dependency is a single call.
+
+        Args:
+            impl: The class, factory function or ready-made instance to provide.
+
+        Returns:
+            A zero-argument function creating the dependency instance.
+        """
+        if isinstance(impl, type):
+            cls = impl
+            try:
+                params = self._class_params(cls)
+            except NameError:
+                # Forward reference to a class that is not defined yet;
+                # introspect the constructor on first use instead.
+                return lambda: self._instantiate_class(cls)
+            return _compile_builder(cls, params, self.resolve, self._providers)
+
+        if callable(impl):
+            factory: Callable[..., Any] = impl
+            return factory
+
+        def get() -> Any:
             return impl
 
-        self._providers[interface] = Provider(provider or factory, scope, init_hook, destroy_hook)
+        return get
 
     def override_provider(
         self,
@@ -118,6 +263,18 @@ class Container:
         """
         self._providers[interface] = Provider(provider, scope)
 
+    def is_singleton(self, target: Any) -> bool:
+        """Checks whether a dependency is registered in the APP scope.
+
+        Args:
+            target: The type or NewType of the dependency.
+
+        Returns:
+            True if every resolution within the APP scope returns the same instance.
+        """
+        provider = self._providers.get(target)
+        return provider is not None and provider.scope == Scope.APP
+
     def resolve(self, target: Any) -> Any:
         """Synchronously resolves a dependency.
 
@@ -127,28 +284,23 @@ class Container:
         Returns:
             The resolved dependency instance.
         """
-        if self._current_scope and target in self._scoped_instances[self._current_scope]:
-            return self._scoped_instances[self._current_scope][target]
-
-        if target in self._scoped_instances[Scope.APP]:
-            return self._scoped_instances[Scope.APP][target]
-
-        provider = self._get_provider(target)
-        self._check_scope(target, provider)
-
-        if target in self._resolution_stack:
-            raise CircularDependencyError(self._resolution_stack + [target])
+        instance = self._app_instances.get(target, _MISS)
+        if instance is not _MISS:
+            return instance
 
+        instance, provider = self._prepare(target)
+        if provider is None:
+            return instance
         self._resolution_stack.append(target)
+        self._resolution_set.add(target)
         try:
             instance = provider.factory()
-            if provider.scope:
-                self._scoped_instances[provider.scope][target] = instance  # type: ignore
+            self._store_instance(provider, target, instance)
             return instance
         except Exception as e:
             raise ProviderError(target, str(e)) from e
         finally:
-            self._resolution_stack.pop()
+            self._resolution_set.discard(self._resolution_stack.pop())
 
     async def resolve_async(self, target: Any) -> Any:
         """Asynchronously resolves a dependency.
@@ -159,32 +311,218 @@ class Container:
         Returns:
             The resolved dependency instance.
         """
-        if self._current_scope and target in self._scoped_instances[self._current_scope]:
-            return self._scoped_instances[self._current_scope][target]
-
-        if target in self._scoped_instances[Scope.APP]:
-            return self._scoped_instances[Scope.APP][target]
-
-        provider = self._get_provider(target)
-        self._check_scope(target, provider)
-
-        if target in self._resolution_stack:
-            raise CircularDependencyError(self._resolution_stack + [target])
+        instance = self._app_instances.get(target, _MISS)
+        if instance is not _MISS:
+            return instance
 
-        self._resolution_stack.append(target)
+        instance, provider = self._prepare(target)
+        if provider is None:
+            return instance
+        token = self._resolution_chain.set((*self._resolution_chain.get(), target))
         try:
             instance = await provider()
-            if provider.scope:
-                self._scoped_instances[provider.scope][target] = instance  # type: ignore
+            self._store_instance(provider, target, instance)
             return instance
         except Exception as e:
             raise ProviderError(target, str(e)) from e
         finally:
-            self._resolution_stack.pop()
+            self._resolution_chain.reset(token)
+
+    async def resolve_many_async(self, *targets: Any) -> list[Any]:
+        """Asynchronously resolves several dependencies at once.
+
+        Dependencies registered with ``independent=True`` are created first and
+        their init hooks are awaited together with ``asyncio.gather``, so that
+        e.g. two database connections are opened concurrently. The remaining
+        targets are then resolved one by one with ``resolve_async``.
+
+        If creating an instance or one of the init hooks fails, the instances
+        that were initialized are kept in their scope, the others are passed to
+        their destroy hooks, and the first error is raised once every hook has
+        finished.
+
+        Args:
+            *targets: The types or NewTypes of the dependencies to resolve.
+
+        Returns:
+            The resolved instances, in the order of ``targets``.
+        """
+        # Imported here: asyncio takes longer to import than the rest of autodi.
+        import asyncio  # noqa: PLC0415
+
+        resolved: dict[Any, Any] = {}
+        created: dict[Any, tuple[Provider, Any]] = {}
+        try:
+            await self._create_independent(targets, resolved, created)
+            results = await asyncio.gather(
+                *(
+                    self._start_instance(provider, target, instance)
+                    for target, (provider, instance) in created.items()
+                ),
+                return_exceptions=True,
+            )
+        except BaseException:
+            await _destroy_instances(created.values())
+            raise
+
+        error: BaseException | None = None
+        failed = []
+        for (target, (provider, instance)), result in zip(created.items(), results, strict=True):
+            if isinstance(result, BaseException):
+                error = error or result
+                failed.append((provider, instance))
+            else:
+                self._store_instance(provider, target, instance)
+                resolved[target] = instance
+        if error is not None:
+            await _destroy_instances(failed)
+            raise error
+
+        for target in targets:
+            if target not in resolved:
+                resolved[target] = await self.resolve_async(target)
+        return [resolved[target] for target in targets]
+
+    async def _create_independent(
+        self,
+        targets: tuple[Any, ...],
+        resolved: dict[Any, Any],
+        created: dict[Any, tuple[Provider, Any]],
+    ) -> None:
+        """Creates the independent targets of ``resolve_many_async`` without initializing them.
+
+        Args:
+            targets: The targets passed to ``resolve_many_async``.
+            resolved: Receives the targets whose instances are already cached.
+            created: Receives the provider and created instance of the other
+                independent targets, including the ones created before an error.
+
+        Raises:
+            ProviderError: If creating an instance fails.
+        """
+        for target in targets:
+            if target in resolved or target in created:
+                continue
+            registered = self._providers.get(target)
+            if registered is None or not registered.independent:
+                continue
+
+            instance = self._app_instances.get(target, _MISS)
+            if instance is not _MISS:
+                resolved[target] = instance
+                continue
+
+            instance, provider = self._prepare(target)
+            if provider is None:
+                resolved[target] = instance
+                continue
+            token = self._resolution_chain.set((*self._resolution_chain.get(), target))
+            try:
+                created[target] = (provider, await provider.create())
+            except Exception as e:
+                raise ProviderError(target, str(e)) from e
+            finally:
+                self._resolution_chain.reset(token)
+
+    async def _start_instance(self, provider: Provider, target: Any, instance: Any) -> None:
+        """Runs the init hook of a created instance.
+
+        Args:
+            provider: The provider that created the instance.
+            target: The dependency the instance was resolved for.
+            instance: The created instance.
+
+        Raises:
+            ProviderError: If the init hook fails.
+        """
+        try:
+            result = provider.start(instance)
+            if _is_awaitable(result):
+                await result
+        except Exception as e:
+            raise ProviderError(target, str(e)) from e
+
+    def _prepare(self, target: Any) -> tuple[Any, Provider | None]:
+        """Performs the lookup, scope and cycle checks shared by both resolve variants.
+
+        On a cache miss the caller must record the target as being resolved
+        (on the resolution stack, or in the resolution chain when resolving
+        asynchronously) until the instance has been created.
+
+        Args:
+            target: The type or NewType of the dependency to resolve.
+
+        Returns:
+            ``(instance, None)`` if the request scope already holds an instance,
+            otherwise ``(_MISS, provider)`` with the provider to create one.
+
+        Raises:
+            CircularDependencyError: If the target is already being resolved.
+        """
+        request_instances = self._request_instances
+        if request_instances is not None:
+            instance = request_instances.get(target, _MISS)
+            if instance is not _MISS:
+                return instance, None
+
+        provider = self._get_provider(target)
+        self._check_scope(target, provider)
+
+        chain = self._resolution_chain.get()
+        if target in self._resolution_set or target in chain:
+            raise CircularDependencyError([*chain, *self._resolution_stack, target])
+        return _MISS, provider
+
+    def _store_instance(self, provider: Provider, target: Any, instance: Any) -> None:
+        """Caches a created instance in the storage of its scope.
+
+        Non-APP instances are only cached while a request scope is active;
+        outside of one they are created anew on every resolution. The bound
+        destroy hook of a cached instance is pushed onto the scope's cleanup stack.
+
+        Args:
+            provider: The provider that created the instance.
+            target: The dependency the instance was resolved for.
+            instance: The created instance.
+        """
+        if provider.scope == Scope.APP:
+            self._app_instances[target] = instance
+            scope: ScopeType = Scope.APP
+        elif self._request_instances is not None:
+            self._request_instances[target] = instance
+            scope = Scope.REQUEST
+        else:
+            return
+
+        if provider.destroy_hook:
+            hook = getattr(instance, provider.destroy_hook, None)
+            if hook is not None:
+                self._cleanup_stacks.setdefault(scope, []).append(hook)
+
+    def _detach_scope(self, scope_name: ScopeType) -> list[Callable[[], Any]]:
+        """Drops the instances cached for a scope.
+
+        Args:
+            scope_name: The name of the scope.
+
+        Returns:
+            The destroy hooks bound for the scope, in creation order.
+        """
+        if scope_name == Scope.APP:
+            self._app_instances = {}
+            return self._cleanup_stacks.pop(Scope.APP, [])
+        if self._request_instances is not None:
+            self._request_instances.clear()
+            self._spare_instances = self._request_instances
+            self._request_instances = None
+        return self._cleanup_stacks.pop(Scope.REQUEST, [])
 
     def _get_provider(self, target: Any) -> Provider:
         """Retrieves or creates a provider for a given target.
 
+        Unregistered classes get a REQUEST-scoped provider, which is kept so
+        that later resolutions of the same class reuse it.
+
         Args:
             target: The type or NewType to find a provider for.
 
@@ -194,7 +532,9 @@ class Container:
         provider = self._providers.get(target)
         if not provider:
             if isinstance(target, type):
-                return Provider(lambda: self._instantiate_class(target), Scope.REQUEST)
+                provider = Provider(lambda: self._instantiate_class(target), Scope.REQUEST)
+                self._providers[target] = provider
+                return provider
             raise DependencyResolutionError(target, "No provider registered")
         return provider
 
@@ -228,18 +568,53 @@ class Container:
         if not hasattr(cls, "__init__") or not callable(cls.__init__):
             return cls()
 
-        signature = inspect.signature(cls.__init__)
-        kwargs = {}
+        params = self._class_params(cls)
+        return cls(
+            **{
+                name: self.resolve(param_type)
+                for name, param_type, has_default in params
+                if not has_default or param_type in self._providers
+            }
+        )
+
+    def _class_params(self, cls: type[Any]) -> tuple[tuple[str, Any, bool], ...]:
+        """Collects the injectable constructor parameters of a class, caching the result.
+
+        String annotations, including postponed ones (``from __future__ import
+        annotations``), are evaluated in the namespace of the module defining
+        ``__init__``, which for an inherited constructor is the base class's module.
+
+        Args:
+            cls: The class to inspect.
+
+        Returns:
+            (name, annotation, has_default) triples for every parameter of
+            ``__init__`` except ``self``, variadic ``*args``/``**kwargs`` and
+            unannotated parameters with a default value.
+
+        Raises:
+            ValueError: If a parameter without a default value has no type annotation.
+            NameError: If a string annotation refers to an undefined name.
+        """
+        cached = self._hints_cache.get(cls)
+        if cached is not None:
+            return cached
+
+        signature = inspect.signature(cls.__init__, eval_str=True)
+        params = []
         for name, param in signature.parameters.items():
-            if name == "self":
+            if name == "self" or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
                 continue
-            param_type = param.annotation
-            if param_type is inspect.Parameter.empty:
+            has_default = param.default is not param.empty
+            if param.annotation is param.empty:
+                if has_default:
+                    continue
                 raise ValueError(
                     f"Parameter '{name}' in {cls.__name__}.__init__ has no type annotation"
                 )
-            kwargs[name] = self.resolve(param_type)
-        return cls(**kwargs)
+            params.append((name, param.annotation, has_default))
+        cached = self._hints_cache[cls] = tuple(params)
+        return cached
 
     @contextmanager
     def enter_scope(self, scope_name: ScopeType) -> Generator[None, None, None]:
@@ -248,61 +623,65 @@ class Container:
         Args:
             scope_name: The name of the scope to enter.
         """
-        if self._current_scope:
-            raise ScopeError(str(scope_name), "Nested scopes are not supported")
-
-        self._current_scope = scope_name
+        self._enter_scope(scope_name)
         try:
             yield
         finally:
             self._cleanup_scope(scope_name)
             self._current_scope = None
 
-    @asynccontextmanager
-    async def enter_scope_async(self, scope_name: ScopeType) -> AsyncGenerator[None, None]:
+    def enter_scope_async(self, scope_name: ScopeType) -> AbstractAsyncContextManager[None]:
         """A context manager for entering an asynchronous scope.
 
         Args:
             scope_name: The name of the scope to enter.
         """
+        scope = self._async_scopes.get(scope_name)
+        if scope is None:
+            scope = self._async_scopes[scope_name] = _AsyncScope(self, scope_name)
+        return scope
+
+    def _enter_scope(self, scope_name: ScopeType) -> None:
+        """Makes a scope the current one.
+
+        Args:
+            scope_name: The name of the scope to enter.
+
+        Raises:
+            ScopeError: If another scope is already active.
+        """
         if self._current_scope:
             raise ScopeError(str(scope_name), "Nested scopes are not supported")
 
         self._current_scope = scope_name
-        try:
-            yield
-        finally:
-            await self._cleanup_scope_async(scope_name)
-            self._current_scope = None
+        if scope_name != Scope.APP:
+            self._request_instances = self._spare_instances
 
     def _cleanup_scope(self, scope_name: ScopeType) -> None:
         """Cleans up a synchronous scope, calling destroy hooks.
 
+        Hooks run in reverse creation order, so dependents are destroyed
+        before the dependencies they were built from.
+
         Args:
             scope_name: The name of the scope to clean up.
         """
-        if scope_name in self._scoped_instances:
-            for interface, instance in self._scoped_instances[scope_name].items():
-                provider = self._providers.get(interface)
-                if provider and provider.destroy_hook and hasattr(instance, provider.destroy_hook):
-                    getattr(instance, provider.destroy_hook)()
-            del self._scoped_instances[scope_name]
+        for hook in self._detach_scope(scope_name)[::-1]:
+            hook()
 
     async def _cleanup_scope_async(self, scope_name: ScopeType) -> None:
         """Cleans up an asynchronous scope, calling destroy hooks.
 
+        Hooks run in reverse creation order, so dependents are destroyed
+        before the dependencies they were built from.
+
         Args:
             scope_name: The name of the scope to clean up.
         """
-        if scope_name in self._scoped_instances:
-            for interface, instance in self._scoped_instances[scope_name].items():
-                provider = self._providers.get(interface)
-                if provider and provider.destroy_hook and hasattr(instance, provider.destroy_hook):
-                    hook = getattr(instance, provider.destroy_hook)
-                    result = hook()
-                    if inspect.isawaitable(result):
-                        await result
-            del self._scoped_instances[scope_name]
+        for hook in self._detach_scope(scope_name)[::-1]:
+            result = hook()
+            if _is_awaitable(result):
+                await result
 
     def cleanup(self) -> None:
         """Cleans up the APP scope synchronously."""
@@ -313,6 +692,55 @@ class Container:
         await self._cleanup_scope_async(Scope.APP)
 
 
+async def _destroy_instances(instances: Iterable[tuple[Provider, Any]]) -> None:
+    """Runs the destroy hooks of instances that could not be stored in their scope.
+
+    Hooks run in reverse creation order. Their errors are suppressed, so that
+    the error which caused the instances to be discarded is the one raised.
+
+    Args:
+        instances: (provider, instance) pairs, in creation order.
+    """
+    for provider, instance in list(instances)[::-1]:
+        hook = getattr(instance, provider.destroy_hook, None) if provider.destroy_hook else None
+        if hook is None:
+            continue
+        with contextlib.suppress(Exception):
+            result = hook()
+            if _is_awaitable(result):
+                await result
+
+
+class _AsyncScope:
+    """The async context manager returned by ``Container.enter_scope_async``.
+
+    Written as a class rather than with ``asynccontextmanager`` so that the
+    module stays compilable with mypyc, which does not support async generators.
+    It keeps no per-entry state, so the container reuses one instance per scope name.
+    """
+
+    __slots__ = ("_container", "_scope_name")
+
+    def __init__(self, container: Container, scope_name: ScopeType) -> None:
+        """Initializes the scope context manager.
+
+        Args:
+            container: The container whose scope is managed.
+            scope_name: The name of the scope to enter.
+        """
+        self._container = container
+        self._scope_name = scope_name
+
+    async def __aenter__(self) -> None:
+        self._container._enter_scope(self._scope_name)
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        try:
+            await self._container._cleanup_scope_async(self._scope_name)
+        finally:
+            self._container._current_scope = None
+
+
 def inject(
     container: Container, *, scope: ScopeType = Scope.APP
 ) -> Callable[[InjectionTarget[T]], InjectionTarget[T]]:
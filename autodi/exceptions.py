@@ -21,6 +21,18 @@ class NoModuleError(AutoDIError):
         return self.message.format(name=self.name, module_name=self.module_name)
 
 
+def _type_name(obj: object) -> str:
+    """Returns the name of a dependency type, falling back to its repr.
+
+    Args:
+        obj: A class, NewType or any other dependency key.
+
+    Returns:
+        A printable name for the object.
+    """
+    return getattr(obj, "__name__", None) or repr(obj)
+
+
 class DependencyError(Exception):
     """Base class for all dependency injection related errors."""
 
@@ -45,8 +57,10 @@ class DependencyResolutionError(DependencyError):
             message: The error message.
         """
         self.dependency = dependency
-        full_message = f"{message}: {dependency.__name__}"
-        super().__init__(full_message)
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        return f"{self.message}: {_type_name(self.dependency)}"
 
 
 class AsyncDependencyError(DependencyError):
@@ -64,9 +78,10 @@ class CircularDependencyError(DependencyError):
             message: The error message.
         """
         self.chain = chain
-        chain_names = " -> ".join(t.__name__ for t in chain)
-        full_message = f"{message}: {chain_names}"
-        super().__init__(full_message)
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        return f"{self.message}: " + " -> ".join(_type_name(t) for t in self.chain)
 
 
 class ScopeError(DependencyError):
@@ -95,5 +110,7 @@ class ProviderError(DependencyError):
             message: The error message.
         """
         self.provider = provider
-        full_message = f"{message} for provider: {provider.__name__}"
-        super().__init__(full_message)
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        return f"{self.message} for provider: {_type_name(self.provider)}"
@@ -1,9 +1,16 @@
-from typing import Any, Protocol, TypeVar, runtime_checkable
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol, TypeVar
 
 T = TypeVar("T")
 
+_log = logging.getLogger("autodi.plugins")
+
+_ALL = frozenset({"*"})
+
+AsyncHook = Callable[[Any], Awaitable[None]]
+
 
-@runtime_checkable
 class ResolvableContainer(Protocol):
     """A protocol defining the interface for a container that can resolve dependencies."""
 
@@ -20,7 +27,19 @@ class ResolvableContainer(Protocol):
 
 
 class DIPlugin:
-    """Base class for DI plugins."""
+    """Base class for DI plugins.
+
+    ``reads`` and ``writes`` name the pieces of state the plugin's hooks touch
+    (e.g. ``{"log"}`` or ``{"metrics"}``). ``ContainerWithPlugins.resolve_async``
+    runs the hooks of plugins whose declarations don't conflict concurrently.
+    The default ``{"*"}`` stands for all state, so unannotated plugins always
+    run one after another.
+    """
+
+    __slots__ = ("__weakref__",)
+
+    reads: frozenset[str] = _ALL
+    writes: frozenset[str] = _ALL
 
     def pre_resolve(self, interface: Any) -> None:
         """Called before a dependency is resolved.
@@ -36,6 +55,26 @@ class DIPlugin:
             instance: The resolved instance.
         """
 
+    async def pre_resolve_async(self, interface: Any) -> None:
+        """Called before a dependency is resolved asynchronously.
+
+        Defaults to calling ``pre_resolve``.
+
+        Args:
+            interface: The dependency being resolved.
+        """
+        self.pre_resolve(interface)
+
+    async def post_resolve_async(self, instance: Any) -> None:
+        """Called after a dependency is resolved asynchronously.
+
+        Defaults to calling ``post_resolve``.
+
+        Args:
+            instance: The resolved instance.
+        """
+        self.post_resolve(instance)
+
 
 class ContainerWithPlugins:
     """A wrapper for a container that allows adding plugins.
@@ -43,14 +82,41 @@ class ContainerWithPlugins:
     Plugins can execute actions before and after dependency resolution.
     """
 
+    __slots__ = (
+        "_container",
+        "_resolve",
+        "_plugins",
+        "_run_pre",
+        "_run_post",
+        "_resolve_async",
+        "_pre_waves",
+        "_post_waves",
+        "__weakref__",
+    )
+
     def __init__(self, container: ResolvableContainer) -> None:
         """Initializes the ContainerWithPlugins.
 
         Args:
             container: The container to wrap.
+
+        Raises:
+            TypeError: If the container has no callable ``resolve`` method.
         """
+        if not callable(getattr(container, "resolve", None)):
+            raise TypeError(
+                f"{type(container).__name__} is not a container: missing a resolve() method"
+            )
         self._container = container
+        self._resolve = container.resolve
+        self._resolve_async: Callable[[Any], Awaitable[Any]] | None = getattr(
+            container, "resolve_async", None
+        )
         self._plugins: list[DIPlugin] = []
+        self._run_pre: Callable[[Any], None] | None = None
+        self._run_post: Callable[[Any], None] | None = None
+        self._pre_waves: tuple[tuple[AsyncHook, ...], ...] = ()
+        self._post_waves: tuple[tuple[AsyncHook, ...], ...] = ()
 
     def add_plugin(self, plugin: DIPlugin) -> None:
         """Adds a new plugin to the container.
@@ -59,6 +125,63 @@ class ContainerWithPlugins:
             plugin: The plugin to add.
         """
         self._plugins.append(plugin)
+        self._rebuild_hooks()
+
+    def remove_plugin(self, plugin: DIPlugin) -> None:
+        """Removes a previously added plugin.
+
+        Args:
+            plugin: The plugin to remove.
+
+        Raises:
+            ValueError: If the plugin was not added to this container.
+        """
+        self._plugins.remove(plugin)
+        self._rebuild_hooks()
+
+    def _rebuild_hooks(self) -> None:
+        """Compiles the bound hooks of the plugins, skipping the ones left as no-ops.
+
+        A hook is only called if the plugin's class overrides the
+        ``DIPlugin`` default, so a plugin implementing only ``post_resolve``
+        costs nothing before resolution. The hooks are published as new
+        functions, so a resolution running concurrently with ``add_plugin``
+        keeps calling a consistent snapshot.
+        """
+        self._run_pre = _compile_hooks(
+            [
+                plugin.pre_resolve
+                for plugin in self._plugins
+                if type(plugin).pre_resolve is not DIPlugin.pre_resolve
+            ]
+        )
+        self._run_post = _compile_hooks(
+            [
+                plugin.post_resolve
+                for plugin in self._plugins
+                if type(plugin).post_resolve is not DIPlugin.post_resolve
+            ]
+        )
+        self._pre_waves = tuple(
+            tuple(plugin.pre_resolve_async for plugin in wave)
+            for wave in _plan_waves(
+                [
+                    plugin
+                    for plugin in self._plugins
+                    if _overrides(plugin, "pre_resolve", "pre_resolve_async")
+                ]
+            )
+        )
+        self._post_waves = tuple(
+            tuple(plugin.post_resolve_async for plugin in wave)
+            for wave in _plan_waves(
+                [
+                    plugin
+                    for plugin in self._plugins
+                    if _overrides(plugin, "post_resolve", "post_resolve_async")
+                ]
+            )
+        )
 
     def resolve(self, target: Any) -> Any:
         """Resolves a dependency, invoking plugin hooks.
@@ -69,26 +192,192 @@ class ContainerWithPlugins:
         Returns:
             The resolved instance.
         """
-        for plugin in self._plugins:
-            plugin.pre_resolve(target)
+        run_pre = self._run_pre
+        if run_pre is not None:
+            run_pre(target)
+
+        instance = self._resolve(target)
+
+        run_post = self._run_post
+        if run_post is not None:
+            run_post(instance)
+        return instance
+
+    async def resolve_async(self, target: Any) -> Any:
+        """Asynchronously resolves a dependency, invoking the async plugin hooks.
+
+        Hooks of plugins with non-conflicting ``reads``/``writes`` run
+        concurrently via ``asyncio.gather``; conflicting ones keep the order
+        in which the plugins were added.
+
+        Args:
+            target: The dependency to resolve.
 
-        instance = self._container.resolve(target)
+        Returns:
+            The resolved instance.
 
-        for plugin in self._plugins:
-            plugin.post_resolve(instance)
+        Raises:
+            TypeError: If the wrapped container has no ``resolve_async`` method.
+        """
+        if self._resolve_async is None:
+            raise TypeError(
+                f"{type(self._container).__name__} does not support asynchronous resolution"
+            )
 
+        await _run_waves(self._pre_waves, target)
+        instance = await self._resolve_async(target)
+        await _run_waves(self._post_waves, instance)
         return instance
 
 
+_INLINE_HOOKS_LIMIT = 4
+"Up to this many hooks are called from generated straight-line code instead of a loop."
+
+
+def _compile_hooks(hooks: list[Callable[[Any], None]]) -> Callable[[Any], None] | None:
+    """Builds a single function calling every hook in order.
+
+    Args:
+        hooks: The bound hooks to call.
+
+    Returns:
+        None if there are no hooks, the hook itself if there is only one,
+        otherwise a function passing its argument to each hook in turn.
+    """
+    if not hooks:
+        return None
+    if len(hooks) == 1:
+        return hooks[0]
+    if len(hooks) > _INLINE_HOOKS_LIMIT:
+        hook_chain = tuple(hooks)
+
+        def run_hooks(argument: Any) -> None:
+            for hook in hook_chain:
+                hook(argument)
+
+        return run_hooks
+
+    namespace: dict[str, Any] = {f"hook{index}": hook for index, hook in enumerate(hooks)}
+    calls = "".join(f"    hook{index}(argument)\n" for index in range(len(hooks)))
+    exec(f"def run_hooks(argument):\n{calls}", namespace)
+    run_hooks_inline: Callable[[Any], None] = namespace["run_hooks"]
+    return run_hooks_inline
+
+
+def _overrides(plugin: DIPlugin, *hook_names: str) -> bool:
+    """Checks whether a plugin's class overrides any of the given DIPlugin hooks.
+
+    Args:
+        plugin: The plugin to inspect.
+        *hook_names: The names of the hooks to check.
+
+    Returns:
+        True if at least one of the hooks is overridden.
+    """
+    plugin_type = type(plugin)
+    return any(getattr(plugin_type, name) is not getattr(DIPlugin, name) for name in hook_names)
+
+
+def _overlap(left: frozenset[str], right: frozenset[str]) -> bool:
+    """Checks whether two state declarations may refer to the same state.
+
+    Args:
+        left: A set of state names, where ``"*"`` stands for all state.
+        right: Another set of state names.
+
+    Returns:
+        True if the declarations intersect.
+    """
+    if not left or not right:
+        return False
+    return "*" in left or "*" in right or not left.isdisjoint(right)
+
+
+def _conflicts(first: DIPlugin, second: DIPlugin) -> bool:
+    """Checks whether the hooks of two plugins must not run concurrently.
+
+    Args:
+        first: A plugin.
+        second: Another plugin.
+
+    Returns:
+        True if either plugin writes state the other one reads or writes.
+    """
+    return (
+        _overlap(first.writes, second.writes)
+        or _overlap(first.writes, second.reads)
+        or _overlap(first.reads, second.writes)
+    )
+
+
+def _plan_waves(plugins: list[DIPlugin]) -> list[list[DIPlugin]]:
+    """Groups plugins into waves whose members can run concurrently.
+
+    Each plugin is placed right after the last wave holding a plugin it
+    conflicts with, so conflicting plugins keep their relative order.
+
+    Args:
+        plugins: The plugins, in the order they were added.
+
+    Returns:
+        The waves, to be run one after another.
+    """
+    waves: list[list[DIPlugin]] = []
+    for plugin in plugins:
+        position = 0
+        for index, wave in enumerate(waves):
+            if any(_conflicts(plugin, other) for other in wave):
+                position = index + 1
+        if position == len(waves):
+            waves.append([plugin])
+        else:
+            waves[position].append(plugin)
+    return waves
+
+
+async def _run_waves(waves: tuple[tuple[AsyncHook, ...], ...], argument: Any) -> None:
+    """Runs waves of async hooks, the hooks of each wave concurrently.
+
+    If a hook fails, the other hooks of its wave are still awaited, the
+    following waves are skipped and the first error is raised.
+
+    Args:
+        waves: The hook waves, as planned by ``_plan_waves``.
+        argument: The value passed to every hook.
+    """
+    for wave in waves:
+        if len(wave) == 1:
+            await wave[0](argument)
+            continue
+
+        # Imported here: asyncio takes longer to import than the rest of autodi.
+        import asyncio  # noqa: PLC0415
+
+        results = await asyncio.gather(*(hook(argument) for hook in wave), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+
 class LoggingPlugin(DIPlugin):
     """An example plugin for logging the dependency resolution process."""
 
-    # TODO: Request a logger Protocol in __init__ instead of using print
+    __slots__ = ("_logger",)
+
+    def __init__(self, logger: logging.Logger | None = None) -> None:
+        """Initializes the LoggingPlugin.
+
+        Args:
+            logger: The logger to write to. Defaults to the ``autodi.plugins`` logger.
+        """
+        self._logger = logger or _log
 
     def pre_resolve(self, interface: Any) -> None:
         """Logs before resolution."""
-        print(f"Resolving {interface.__name__}...")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Resolving %s...", getattr(interface, "__name__", interface))
 
     def post_resolve(self, instance: Any) -> None:
         """Logs after resolution."""
-        print(f"Resolved {instance.__class__.__name__} instance.")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Resolved %s instance.", instance.__class__.__name__)
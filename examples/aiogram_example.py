@@ -1,12 +1,8 @@
 import asyncio
+import sys
 from collections.abc import Awaitable, Callable
 from typing import Any
 
-from aiogram import Bot, Dispatcher
-from aiogram.filters import CommandStart
-from aiogram.types import Message
-from aiogram.dispatcher.middlewares.base import BaseMiddleware
-
 from autodi import Container, Scope
 
 # --- Define Dependencies ---
@@ -45,7 +41,7 @@ class UserService:
         Returns:
             A greeting string for the user.
         """
-        print(f"Greeting user {user_id}")
+        sys.stdout.write(f"Greeting user {user_id}\n")
         return self._greeting_service.get_greeting(name)
 
 # --- Configure Container ---
@@ -58,53 +54,66 @@ container.register(UserService, scope=Scope.REQUEST) # Created for each incoming
 
 # --- Setup Aiogram ---
 
-# In a real app, the token should be loaded from a secure source
-# bot = Bot(token="YOUR_TOKEN")
-dp = Dispatcher()
 
+def create_dispatcher():
+    """Builds the aiogram dispatcher with the DI middleware and handlers.
 
-class DiMiddleware(BaseMiddleware):
-    """Middleware to manage dependency scopes for each incoming update."""
-    def __init__(self, container: Container):
-        """Initializes the DiMiddleware.
+    aiogram is imported here rather than at module level, so importing this
+    module (e.g. just for `container`) doesn't pay for the framework.
+    """
+    from aiogram import Dispatcher
+    from aiogram.dispatcher.middlewares.base import BaseMiddleware
+    from aiogram.filters import CommandStart
+    from aiogram.types import Message
 
-        Args:
-            container: The autodi container instance.
-        """
-        self.container = container
+    dp = Dispatcher()
 
-    async def __call__(
-        self, handler: Callable[..., Awaitable[Any]], event: Message, data: dict
-    ) -> Any:
-        """Enters an async scope and resolves dependencies for the handler.
+    class DiMiddleware(BaseMiddleware):
+        """Middleware to manage dependency scopes for each incoming update."""
+        def __init__(self, container: Container):
+            """Initializes the DiMiddleware.
 
-        Args:
-            handler: The next handler in the chain.
-            event: The incoming event (Message).
-            data: The data to be passed to the handler.
+            Args:
+                container: The autodi container instance.
+            """
+            self.container = container
 
-        Returns:
-            The result of the handler.
-        """
-        async with self.container.enter_scope_async(Scope.REQUEST):
-            data["user_service"] = await self.container.resolve_async(UserService)
-            return await handler(event, data)
+        async def __call__(
+            self, handler: Callable[..., Awaitable[Any]], event: Message, data: dict
+        ) -> Any:
+            """Enters an async scope and resolves dependencies for the handler.
+
+            Args:
+                handler: The next handler in the chain.
+                event: The incoming event (Message).
+                data: The data to be passed to the handler.
 
-dp.update.outer_middleware.register(DiMiddleware(container))
+            Returns:
+                The result of the handler.
+            """
+            async with self.container.enter_scope_async(Scope.REQUEST):
+                data["user_service"] = await self.container.resolve_async(UserService)
+                return await handler(event, data)
 
+    @dp.message(CommandStart())
+    async def start_handler(message: Message, user_service: UserService):
+        """Handler for the /start command."""
+        user = message.from_user
+        greeting = user_service.greet_user(user.id, user.full_name) # type: ignore
+        await message.answer(greeting)
 
-@dp.message(CommandStart())
-async def start_handler(message: Message, user_service: UserService):
-    """Handler for the /start command."""
-    user = message.from_user
-    greeting = user_service.greet_user(user.id, user.full_name) # type: ignore
-    await message.answer(greeting)
+    dp.update.outer_middleware.register(DiMiddleware(container))
+    return dp
 
 
 async def main():
     """Main function to run the bot."""
+    dp = create_dispatcher()
+    # In a real app, the token should be loaded from a secure source
+    # from aiogram import Bot
+    # bot = Bot(token="YOUR_TOKEN")
     # To run this example:
-    # 1. Uncomment the following line
+    # 1. Uncomment the `bot` lines above and the following line
     # 2. Replace "YOUR_TOKEN" with your actual bot token
     # await dp.start_polling(bot)
     print("Aiogram example updated. To run, set a bot token and uncomment start_polling.")
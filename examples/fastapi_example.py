@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-from typing import NewType
-
-from fastapi import Depends, FastAPI
+import functools
+import sys
+from typing import TYPE_CHECKING, NewType
 
 from autodi import Container, Scope
-from autodi.extensions.fastapi import setup_dependency_injection
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 # --- Define Dependencies ---
 
@@ -20,16 +22,18 @@ class Database:
         """
         self._url = db_url
         self._is_connected = False
+        self._connect_msg = f"DB: Connecting to {db_url}...\n"
+        self._close_msg = f"DB: Closing connection to {db_url}...\n"
 
     async def connect(self):
         """Simulates an asynchronous connection to the database."""
-        print(f"DB: Connecting to {self._url}...")
+        sys.stdout.write(self._connect_msg)
         await asyncio.sleep(0.01)
         self._is_connected = True
 
     async def close(self):
         """Simulates an asynchronous disconnection from the database."""
-        print(f"DB: Closing connection to {self._url}...")
+        sys.stdout.write(self._close_msg)
         await asyncio.sleep(0.01)
         self._is_connected = False
 
@@ -61,6 +65,7 @@ container.register(
     scope=Scope.REQUEST,
     init_hook="connect",
     destroy_hook="close",
+    independent=True,  # `connect` shares no state, so it may overlap with other connects
 )
 
 # Register the replica database
@@ -70,35 +75,65 @@ container.register(
     scope=Scope.REQUEST,
     init_hook="connect",
     destroy_hook="close",
+    independent=True,  # `connect` shares no state, so it may overlap with other connects
 )
 
 # --- Setup FastAPI ---
 
-app = FastAPI(title="autodi FastAPI Example")
+async def _both_databases():
+    """Resolves both databases at request start, connecting to them concurrently."""
+    return await container.resolve_many_async(PrimaryDatabase, ReplicaDatabase)
+
+
+def create_app() -> FastAPI:
+    """Builds the FastAPI application.
+
+    FastAPI is imported here rather than at module level, so importing this
+    module (e.g. just for `container`) doesn't pay for the framework.
+    """
+    from fastapi import Depends, FastAPI
+
+    from autodi.extensions.fastapi import setup_dependency_injection
+
+    app = FastAPI(title="autodi FastAPI Example")
+
+    # This middleware will manage the REQUEST scope for each incoming request
+    setup_dependency_injection(app, container)
 
-# This middleware will manage the REQUEST scope for each incoming request
-setup_dependency_injection(app, container)
+    @functools.lru_cache(maxsize=None)
+    def _depends_for(dep_type):
+        """Creates the FastAPI dependency resolving `dep_type`, once per type."""
+        _resolve = container.resolve_async
 
+        async def _dep():
+            return await _resolve(dep_type)
 
-# --- Define Endpoints ---
+        return Depends(_dep)
 
-def resolve(dep_type):
-    """A helper to create a FastAPI dependency from a container resolution."""
-    return Depends(lambda: container.resolve_async(dep_type))
+    # --- Define Endpoints ---
 
+    @app.get("/users")
+    async def get_users(db: PrimaryDatabase = _depends_for(PrimaryDatabase)):
+        """This endpoint reads from the primary database."""
+        users = db.query("SELECT * FROM users")
+        return {"source": "primary", "users": users}
 
-@app.get("/users")
-async def get_users(db: PrimaryDatabase = resolve(PrimaryDatabase)):
-    """This endpoint reads from the primary database."""
-    users = db.query("SELECT * FROM users")
-    return {"source": "primary", "users": users}
+    @app.get("/reports")
+    async def get_reports(db: ReplicaDatabase = _depends_for(ReplicaDatabase)):
+        """This endpoint reads from the replica database."""
+        reports = db.query("SELECT * FROM reports")
+        return {"source": "replica", "reports": reports}
 
+    @app.get("/consistency")
+    async def check_consistency(dbs: list[Database] = Depends(_both_databases)):
+        """This endpoint reads from both databases, whose connections were opened in parallel."""
+        primary, replica = dbs
+        return {
+            "primary": primary.query("SELECT count(*) FROM users"),
+            "replica": replica.query("SELECT count(*) FROM users"),
+        }
 
-@app.get("/reports")
-async def get_reports(db: ReplicaDatabase = resolve(ReplicaDatabase)):
-    """This endpoint reads from the replica database."""
-    reports = db.query("SELECT * FROM reports")
-    return {"source": "replica", "reports": reports}
+    return app
 
 
-# To run: uvicorn examples.fastapi_example:app --reload
\ No newline at end of file
+# To run: uvicorn examples.fastapi_example:create_app --factory --reload
@@ -1,4 +1,6 @@
 import asyncio
+import sys
+
 from autodi import Container, Scope
 
 
@@ -13,20 +15,21 @@ class DatabaseConnection:
         """
         self._db_name = db_name
         self._is_connected = False
+        self._connect_msg = f"DB: Connecting to {db_name}...\n"
 
     async def connect(self):
         """Simulates an asynchronous connection to the database."""
-        print(f"DB: Connecting to {self._db_name}...")
+        sys.stdout.write(self._connect_msg)
         await asyncio.sleep(0.01)  # Simulate async I/O
         self._is_connected = True
-        print("DB: Connected.")
+        sys.stdout.write("DB: Connected.\n")
 
     async def close(self):
         """Simulates an asynchronous disconnection from the database."""
-        print("DB: Closing connection...")
+        sys.stdout.write("DB: Closing connection...\n")
         await asyncio.sleep(0.01)
         self._is_connected = False
-        print("DB: Closed.")
+        sys.stdout.write("DB: Closed.\n")
 
     def query(self, sql: str) -> str:
         """Simulates querying the database.
@@ -39,7 +42,7 @@ class DatabaseConnection:
         """
         if not self._is_connected:
             raise RuntimeError("Database is not connected")
-        return f'Result for "{sql}'"
+        return f'Result for "{sql}"'
 
 
 async def main():
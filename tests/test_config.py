@@ -0,0 +1,212 @@
+import collections
+import os
+
+import pytest
+import yaml
+
+from autodi import Container, DIConfig
+from autodi.config import config as config_module
+
+CONFIG = """\
+dependencies:
+  collections.OrderedDict:
+    scope: app
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_parse_cache(monkeypatch):
+    monkeypatch.setattr(config_module, "_PARSE_CACHE", {})
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "di.yaml"
+    path.write_text(CONFIG)
+    return path
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Counts the calls to DIConfig._parse."""
+    calls = []
+    parse = DIConfig._parse
+
+    def counting_parse(self, *args):
+        calls.append(args)
+        return parse(self, *args)
+
+    monkeypatch.setattr(DIConfig, "_parse", counting_parse)
+    return calls
+
+
+def load(path):
+    container = Container()
+    DIConfig(container).load_from_yaml(path)
+    return container
+
+
+def test_load_registers_dependencies(config_file):
+    container = load(config_file)
+
+    assert container.is_singleton(collections.OrderedDict)
+    assert isinstance(container.resolve(collections.OrderedDict), collections.OrderedDict)
+
+
+def test_loading_the_same_file_twice_parses_it_once(config_file, parse_calls):
+    load(config_file)
+    container = load(config_file)
+
+    assert len(parse_calls) == 1
+    assert container.is_singleton(collections.OrderedDict)
+
+
+def test_touching_the_file_parses_it_again(config_file, parse_calls):
+    load(config_file)
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    load(config_file)
+
+    assert len(parse_calls) == 2
+
+
+def test_rewriting_the_file_parses_it_again(config_file, parse_calls):
+    load(config_file)
+    stat = config_file.stat()
+    config_file.write_text(CONFIG.replace("app", "request"))
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    container = load(config_file)
+
+    assert len(parse_calls) == 2
+    assert not container.is_singleton(collections.OrderedDict)
+
+
+@pytest.mark.parametrize(
+    "loader",
+    [
+        yaml.SafeLoader,
+        pytest.param(
+            getattr(yaml, "CSafeLoader", None),
+            marks=pytest.mark.skipif(not yaml.__with_libyaml__, reason="libyaml not available"),
+        ),
+    ],
+)
+def test_load_works_with_either_loader(config_file, monkeypatch, loader):
+    monkeypatch.setattr(config_module, "_SafeLoader", loader)
+
+    container = load(config_file)
+
+    assert container.is_singleton(collections.OrderedDict)
+
+
+def test_unknown_class_is_reported_by_its_path(tmp_path):
+    path = tmp_path / "di.yaml"
+    path.write_text("dependencies:\n  collections.NoSuchClass:\n    scope: app\n")
+
+    with pytest.raises(ValueError, match="collections.NoSuchClass"):
+        load(path)
+
+
+def test_scope_defaults_to_app(tmp_path):
+    path = tmp_path / "di.yaml"
+    path.write_text("dependencies:\n  collections.OrderedDict: {}\n")
+
+    container = load(path)
+
+    assert container.is_singleton(collections.OrderedDict)
+
+
+@pytest.fixture
+def read_calls(monkeypatch):
+    """Counts the calls to DIConfig._read_entries, i.e. the YAML parses."""
+    calls = []
+    read_entries = DIConfig._read_entries
+
+    def counting_read_entries(self, path):
+        calls.append(path)
+        return read_entries(self, path)
+
+    monkeypatch.setattr(DIConfig, "_read_entries", counting_read_entries)
+    return calls
+
+
+def cache_path_of(path):
+    return path.with_name(path.name + config_module._CACHE_SUFFIX)
+
+
+def reload(path):
+    """Loads a config again, bypassing the in-process cache."""
+    config_module._PARSE_CACHE.clear()
+    return load(path)
+
+
+def test_disk_cache_round_trip(config_file, read_calls):
+    load(config_file)
+    container = reload(config_file)
+
+    assert cache_path_of(config_file).exists()
+    assert len(read_calls) == 1
+    assert container.is_singleton(collections.OrderedDict)
+
+
+def test_disk_cache_is_ignored_when_the_file_changes(config_file, read_calls):
+    load(config_file)
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reload(config_file)
+
+    assert len(read_calls) == 2
+
+
+def test_disk_cache_is_ignored_when_the_size_changes(config_file, read_calls):
+    load(config_file)
+    stat = config_file.stat()
+    config_file.write_text(CONFIG.replace("app", "request"))
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    container = reload(config_file)
+
+    assert len(read_calls) == 2
+    assert not container.is_singleton(collections.OrderedDict)
+
+
+def test_disk_cache_is_ignored_after_a_version_change(config_file, read_calls, monkeypatch):
+    load(config_file)
+    monkeypatch.setattr(config_module, "_CACHE_VERSION", config_module._CACHE_VERSION + 1)
+    reload(config_file)
+    reload(config_file)
+
+    assert len(read_calls) == 2
+
+
+def test_corrupt_disk_cache_falls_back_to_yaml(config_file, read_calls):
+    cache_path_of(config_file).write_bytes(b"not a marshal dump")
+    container = load(config_file)
+    reload(config_file)
+
+    assert len(read_calls) == 1
+    assert container.is_singleton(collections.OrderedDict)
+
+
+def test_unwritable_cache_is_skipped(config_file, monkeypatch):
+    def deny(*args):
+        raise PermissionError("read-only file system")
+
+    monkeypatch.setattr(config_module.os, "replace", deny)
+    container = load(config_file)
+
+    assert container.is_singleton(collections.OrderedDict)
+    assert [path.name for path in config_file.parent.iterdir()] == [config_file.name]
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0, reason="needs POSIX permissions as non-root"
+)
+def test_read_only_directory_is_skipped(config_file):
+    config_file.parent.chmod(0o555)
+    try:
+        container = load(config_file)
+    finally:
+        config_file.parent.chmod(0o755)
+
+    assert container.is_singleton(collections.OrderedDict)
+    assert not cache_path_of(config_file).exists()
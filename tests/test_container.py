@@ -0,0 +1,329 @@
+import asyncio
+import sys
+import time
+import types
+import weakref
+
+import pytest
+
+import autodi.container
+from autodi import Container, ContainerWithPlugins, DIPlugin, ProviderError, Scope
+from autodi.utils.plugins import LoggingPlugin
+
+
+@pytest.fixture
+def make_module():
+    """Creates importable modules from source, removing them after the test."""
+    created = []
+
+    def make(name: str, source: str) -> types.ModuleType:
+        module = types.ModuleType(name)
+        sys.modules[name] = module
+        created.append(name)
+        exec(source, vars(module))  # noqa: S102
+        return module
+
+    yield make
+    for name in created:
+        del sys.modules[name]
+
+
+def test_inherited_init_annotations_use_defining_module(make_module):
+    base = make_module(
+        "autodi_test_base",
+        "from __future__ import annotations\n"
+        "class Repo: pass\n"
+        "class Base:\n"
+        "    def __init__(self, repo: Repo):\n"
+        "        self.repo = repo\n",
+    )
+    child = make_module(
+        "autodi_test_child",
+        "from autodi_test_base import Base\n" "class Repo: pass\n" "class Child(Base): pass\n",
+    )
+    container = Container()
+    container.register(child.Child)
+
+    assert type(container.resolve(child.Child).repo) is base.Repo
+
+
+class Repo:
+    pass
+
+
+class Cache:
+    pass
+
+
+def test_builder_passes_keyword_only_parameters():
+    class Service:
+        def __init__(self, repo: Repo, *, cache: Cache) -> None:
+            self.repo = repo
+            self.cache = cache
+
+    container = Container()
+    container.register(Service)
+
+    service = container.resolve(Service)
+
+    assert isinstance(service.repo, Repo)
+    assert isinstance(service.cache, Cache)
+
+
+def test_builder_keeps_defaults_of_unregistered_types():
+    class Service:
+        def __init__(self, repo: Repo, timeout: int = 5, cache: Cache | None = None, retries=3):
+            self.repo = repo
+            self.timeout = timeout
+            self.cache = cache
+            self.retries = retries
+
+    container = Container()
+    container.register(Service)
+
+    service = container.resolve(Service)
+
+    assert isinstance(service.repo, Repo)
+    assert (service.timeout, service.cache, service.retries) == (5, None, 3)
+
+
+def test_builder_injects_registered_types_with_defaults():
+    class Service:
+        def __init__(self, timeout: int = 5) -> None:
+            self.timeout = timeout
+
+    container = Container()
+    container.register(Service)
+    container.register(int, provider=lambda: 30)
+
+    assert container.resolve(Service).timeout == 30
+
+
+def test_builder_ignores_variadic_parameters():
+    class Service:
+        def __init__(self, repo: Repo, *args, **kwargs) -> None:
+            self.repo = repo
+            self.extra = (args, kwargs)
+
+    container = Container()
+    container.register(Service)
+
+    service = container.resolve(Service)
+
+    assert isinstance(service.repo, Repo)
+    assert service.extra == ((), {})
+
+
+def test_undefined_forward_reference_is_resolved_on_first_use(make_module):
+    module = make_module(
+        "autodi_test_forward",
+        "class Service:\n"
+        "    def __init__(self, dependency: 'Later'):\n"
+        "        self.dependency = dependency\n",
+    )
+    container = Container()
+    container.register(module.Service)
+    exec("class Later: pass", vars(module))
+
+    assert isinstance(container.resolve(module.Service).dependency, module.Later)
+
+
+@pytest.mark.skipif(
+    not autodi.container.__file__.endswith(".py"),
+    reason="mypyc-compiled classes do not support weak references",
+)
+def test_container_supports_weak_references():
+    container = Container()
+
+    assert weakref.ref(container)() is container
+
+
+def test_plugin_wrapper_and_plugins_support_weak_references():
+    wrapper = ContainerWithPlugins(Container())
+    plugins = [DIPlugin(), LoggingPlugin()]
+
+    assert weakref.ref(wrapper)() is wrapper
+    assert [weakref.ref(plugin)() for plugin in plugins] == plugins
+
+
+class Resource:
+    """Records its lifecycle; ``connect`` sleeps ``delay`` seconds, or fails if ``fail`` is set."""
+
+    delay = 0.0
+    fail = False
+
+    def __init__(self) -> None:
+        self.events: list[str] = []
+
+    async def connect(self) -> None:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{type(self).__name__} is unavailable")
+        self.events.append("connect")
+
+    async def close(self) -> None:
+        self.events.append("close")
+
+
+class Primary(Resource):
+    delay = 0.05
+
+
+class Replica(Resource):
+    delay = 0.05
+
+
+class Broken(Resource):
+    fail = True
+
+
+class Plain:
+    pass
+
+
+def register_resource(container: Container, cls: type, **kwargs) -> None:
+    container.register(
+        cls,
+        scope=Scope.REQUEST,
+        init_hook="connect",
+        destroy_hook="close",
+        independent=True,
+        **kwargs,
+    )
+
+
+async def test_resolve_many_async_keeps_order_and_deduplicates():
+    container = Container()
+    register_resource(container, Primary)
+    register_resource(container, Replica)
+
+    async with container.enter_scope_async(Scope.REQUEST):
+        replica, plain, primary, replica_again = await container.resolve_many_async(
+            Replica, Plain, Primary, Replica
+        )
+
+    assert (type(replica), type(plain), type(primary)) == (Replica, Plain, Primary)
+    assert replica is replica_again
+    assert replica.events == ["connect", "close"]
+
+
+async def test_resolve_many_async_runs_init_hooks_concurrently():
+    container = Container()
+    register_resource(container, Primary)
+    register_resource(container, Replica)
+
+    async with container.enter_scope_async(Scope.REQUEST):
+        start = time.perf_counter()
+        await container.resolve_many_async(Primary, Replica)
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < Primary.delay + Replica.delay
+
+
+async def test_resolve_many_async_init_hook_failure_waits_for_other_hooks():
+    created: list[Primary] = []
+
+    def make_primary() -> Primary:
+        created.append(Primary())
+        return created[-1]
+
+    container = Container()
+    register_resource(container, Primary, provider=make_primary)
+    register_resource(container, Broken)
+
+    async with container.enter_scope_async(Scope.REQUEST):
+        with pytest.raises(ProviderError, match="Broken is unavailable"):
+            await container.resolve_many_async(Primary, Broken)
+        # The surviving hook has finished and its instance belongs to this scope.
+        assert created[0].events == ["connect"]
+    assert created[0].events == ["connect", "close"]
+
+    async with container.enter_scope_async(Scope.REQUEST):
+        assert await container.resolve_async(Primary) is created[1]
+    assert created[0].events == ["connect", "close"]
+
+
+async def test_resolve_many_async_destroys_instances_when_creation_fails():
+    container = Container()
+    primary = Primary()
+    register_resource(container, Primary, provider=lambda: primary)
+
+    def fail() -> Resource:
+        raise RuntimeError("no replica")
+
+    register_resource(container, Replica, provider=fail)
+
+    async with container.enter_scope_async(Scope.REQUEST):
+        with pytest.raises(ProviderError, match="no replica"):
+            await container.resolve_many_async(Primary, Replica)
+
+    assert primary.events == ["close"]
+
+
+async def test_independent_init_hooks_may_resolve_the_same_dependency():
+    class Settings(Resource):
+        delay = 0.01
+
+    class Client:
+        def __init__(self) -> None:
+            self.settings: Settings | None = None
+
+        async def connect(self) -> None:
+            self.settings = await container.resolve_async(Settings)
+
+    class OtherClient(Client):
+        pass
+
+    container = Container()
+    container.register(Settings, scope=Scope.APP, init_hook="connect")
+    container.register(Client, scope=Scope.APP, init_hook="connect", independent=True)
+    container.register(OtherClient, scope=Scope.APP, init_hook="connect", independent=True)
+
+    client, other = await container.resolve_many_async(Client, OtherClient)
+
+    assert isinstance(client.settings, Settings)
+    assert isinstance(other.settings, Settings)
+
+
+class RequestState:
+    def __init__(self) -> None:
+        self.closed = 0
+
+    def close(self) -> None:
+        self.closed += 1
+
+
+def test_request_scopes_do_not_share_instances():
+    container = Container()
+    container.register(RequestState, scope=Scope.REQUEST, destroy_hook="close")
+    seen = []
+
+    for _ in range(3):
+        with container.enter_scope(Scope.REQUEST):
+            state = container.resolve(RequestState)
+            assert container.resolve(RequestState) is state
+            seen.append(state)
+    with pytest.raises(RuntimeError), container.enter_scope(Scope.REQUEST):
+        seen.append(container.resolve(RequestState))
+        raise RuntimeError("handler failed")
+
+    assert len({id(state) for state in seen}) == len(seen)
+    assert [state.closed for state in seen] == [1] * len(seen)
+    assert container.resolve(RequestState) not in seen
+
+
+async def test_async_request_scopes_do_not_share_instances():
+    container = Container()
+    container.register(RequestState, scope=Scope.REQUEST, destroy_hook="close")
+    seen = []
+
+    for _ in range(3):
+        async with container.enter_scope_async(Scope.REQUEST):
+            state = await container.resolve_async(RequestState)
+            assert await container.resolve_async(RequestState) is state
+            seen.append(state)
+    with container.enter_scope(Scope.REQUEST):
+        seen.append(container.resolve(RequestState))
+
+    assert len({id(state) for state in seen}) == len(seen)
+    assert [state.closed for state in seen] == [1] * len(seen)
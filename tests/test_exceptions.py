@@ -0,0 +1,104 @@
+from typing import NewType
+
+import pytest
+
+from autodi import (
+    CircularDependencyError,
+    Container,
+    DependencyResolutionError,
+    ProviderError,
+    ScopeError,
+)
+
+UserId = NewType("UserId", int)
+
+
+class Database:
+    def __init__(self) -> None:
+        raise RuntimeError("db down")
+
+
+class Repository:
+    def __init__(self, db: Database) -> None:
+        self.db = db
+
+
+class Left:
+    def __init__(self, right: "Right") -> None:
+        self.right = right
+
+
+class Right:
+    def __init__(self, left: Left) -> None:
+        self.left = left
+
+
+def test_dependency_resolution_error_text():
+    error = DependencyResolutionError(UserId, "No provider registered")
+
+    assert str(error) == "No provider registered: UserId"
+    assert error.args == ("No provider registered",)
+    assert error.message == "No provider registered"
+    assert error.dependency is UserId
+
+
+def test_circular_dependency_error_text():
+    error = CircularDependencyError([Left, Right, Left])
+
+    assert str(error) == "Circular dependency detected: Left -> Right -> Left"
+    assert error.args == ("Circular dependency detected",)
+    assert error.chain == [Left, Right, Left]
+
+
+def test_provider_error_text():
+    error = ProviderError(Database, "db down")
+
+    assert str(error) == "db down for provider: Database"
+    assert error.args == ("db down",)
+    assert error.message == "db down"
+    assert error.provider is Database
+
+
+def test_scope_error_text():
+    error = ScopeError("request", "Nested scopes are not supported")
+
+    assert str(error) == "Nested scopes are not supported (scope: request)"
+    assert error.args == ("Nested scopes are not supported (scope: request)",)
+
+
+def test_unregistered_new_type_is_named_in_the_error():
+    with pytest.raises(DependencyResolutionError) as info:
+        Container().resolve(UserId)
+
+    assert str(info.value) == "No provider registered: UserId"
+
+
+def test_nested_provider_errors_name_every_provider():
+    container = Container()
+    container.register(Repository)
+    container.register(Database)
+
+    with pytest.raises(ProviderError) as info:
+        container.resolve(Repository)
+
+    error = info.value
+    assert str(error) == "db down for provider: Database for provider: Repository"
+    assert error.args == ("db down for provider: Database",)
+    assert error.provider is Repository
+    assert str(error.__context__) == "db down for provider: Database"
+    assert isinstance(error.__context__.__context__, RuntimeError)
+
+
+def test_circular_dependency_is_reported_through_the_providers():
+    container = Container()
+    container.register(Left)
+    container.register(Right)
+
+    with pytest.raises(ProviderError) as info:
+        container.resolve(Left)
+
+    assert str(info.value) == (
+        "Circular dependency detected: Left -> Right -> Left "
+        "for provider: Right for provider: Left"
+    )
+    assert isinstance(info.value.__context__.__context__, CircularDependencyError)
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+
+import pytest
+
+from autodi import Container, ContainerWithPlugins, DIPlugin
+from autodi.utils.plugins import _INLINE_HOOKS_LIMIT, LoggingPlugin, _compile_hooks
+
+
+class Session:
+    pass
+
+
+class RecordingPlugin(DIPlugin):
+    """Records when its async pre-resolve hook starts and ends."""
+
+    def __init__(self, name, events):
+        self._name = name
+        self._events = events
+
+    async def pre_resolve_async(self, interface):
+        self._events.append(f"{self._name} start")
+        await asyncio.sleep(0.01)
+        self._events.append(f"{self._name} end")
+
+
+class MetricsWriter(RecordingPlugin):
+    reads = frozenset()
+    writes = frozenset({"metrics"})
+
+
+class TraceWriter(RecordingPlugin):
+    reads = frozenset()
+    writes = frozenset({"trace"})
+
+
+class MetricsReader(RecordingPlugin):
+    reads = frozenset({"metrics"})
+    writes = frozenset()
+
+
+async def resolve_with(*plugins):
+    wrapper = ContainerWithPlugins(Container())
+    for plugin in plugins:
+        wrapper.add_plugin(plugin)
+    await wrapper.resolve_async(Session)
+
+
+async def test_undeclared_plugins_run_one_after_another():
+    events: list[str] = []
+    await resolve_with(RecordingPlugin("a", events), RecordingPlugin("b", events))
+
+    assert events == ["a start", "a end", "b start", "b end"]
+
+
+async def test_disjoint_plugins_run_concurrently():
+    events: list[str] = []
+    await resolve_with(
+        MetricsWriter("a", events),
+        TraceWriter("b", events),
+    )
+
+    assert events == ["a start", "b start", "a end", "b end"]
+
+
+async def test_conflicting_plugin_runs_after_the_earlier_one():
+    events: list[str] = []
+    await resolve_with(
+        MetricsWriter("a", events),
+        TraceWriter("b", events),
+        MetricsReader("c", events),
+    )
+
+    assert events.index("c start") > events.index("a end")
+    assert events.index("b start") < events.index("a end")
+
+
+def test_sync_resolve_ignores_async_only_hooks():
+    events: list[str] = []
+    wrapper = ContainerWithPlugins(Container())
+    wrapper.add_plugin(RecordingPlugin("a", events))
+
+    wrapper.resolve(Session)
+
+    assert events == []
+
+
+class FailingTraceWriter(TraceWriter):
+    async def pre_resolve_async(self, interface):
+        self._events.append(f"{self._name} failed")
+        raise RuntimeError("trace backend down")
+
+
+async def test_failing_hook_waits_for_its_wave_and_stops_later_ones():
+    events: list[str] = []
+
+    with pytest.raises(RuntimeError, match="trace backend down"):
+        await resolve_with(
+            MetricsWriter("a", events),
+            FailingTraceWriter("b", events),
+            MetricsReader("c", events),
+        )
+
+    assert events == ["a start", "b failed", "a end"]
+
+
+class OrderPlugin(DIPlugin):
+    """Records the order in which its sync hooks are called."""
+
+    def __init__(self, index, calls):
+        self._index = index
+        self._calls = calls
+
+    def pre_resolve(self, interface):
+        self._calls.append(("pre", self._index))
+
+    def post_resolve(self, instance):
+        self._calls.append(("post", self._index))
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 4, 5, 8])
+def test_hooks_run_in_order_for_any_plugin_count(count):
+    calls: list[tuple[str, int]] = []
+    wrapper = ContainerWithPlugins(Container())
+    for index in range(count):
+        wrapper.add_plugin(OrderPlugin(index, calls))
+
+    assert isinstance(wrapper.resolve(Session), Session)
+    assert calls == [("pre", i) for i in range(count)] + [("post", i) for i in range(count)]
+
+
+def test_compiled_hook_chain_shapes():
+    calls: list[tuple[str, int]] = []
+    hooks = [OrderPlugin(index, calls).pre_resolve for index in range(6)]
+
+    assert _compile_hooks([]) is None
+    assert _compile_hooks(hooks[:1]) == hooks[0]
+    inline = _compile_hooks(hooks[:_INLINE_HOOKS_LIMIT])
+    looped = _compile_hooks(hooks)
+    assert "hook0" in inline.__globals__
+    assert "hook0" not in looped.__globals__
+
+    inline(Session)
+    looped(Session)
+    assert calls == [("pre", i) for i in range(_INLINE_HOOKS_LIMIT)] + [
+        ("pre", i) for i in range(6)
+    ]
+
+
+def test_removing_a_plugin_rebuilds_the_chain():
+    calls: list[tuple[str, int]] = []
+    wrapper = ContainerWithPlugins(Container())
+    plugins = [OrderPlugin(index, calls) for index in range(3)]
+    for plugin in plugins:
+        wrapper.add_plugin(plugin)
+    wrapper.remove_plugin(plugins[1])
+
+    wrapper.resolve(Session)
+
+    assert calls == [("pre", 0), ("pre", 2), ("post", 0), ("post", 2)]
+
+
+def test_logging_plugin_names_the_resolved_types(caplog):
+    wrapper = ContainerWithPlugins(Container())
+    wrapper.add_plugin(LoggingPlugin())
+
+    with caplog.at_level(logging.DEBUG, logger="autodi.plugins"):
+        wrapper.resolve(Session)
+
+    assert caplog.messages == ["Resolving Session...", "Resolved Session instance."]